@@ -1,22 +1,38 @@
 """
 Main FastAPI application entry point
 """
-from fastapi import FastAPI, Depends, HTTPException, status
+from contextlib import asynccontextmanager
+from datetime import datetime
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from typing import List
-from prometheus_fastapi_instrumentator import Instrumentator
+import os
 
 from . import models, schemas, crud
-from .database import engine, get_db
+from .compression import CompressionMiddleware
+from .database import get_db, init_db
+from .metrics import DeferredInstrumentationMiddleware, metrics_endpoint
+from .negotiation import COLUMNAR_JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, listing_response
+
+# Fast-start mode defers engine creation, schema checks and metrics registration
+# until the first request that needs them (quicker cold starts and test runs)
+FAST_START = os.getenv("FAST_START", "false").lower() in ("1", "true", "yes")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the engine and database tables at startup unless fast-start is enabled"""
+    if not FAST_START:
+        init_db()
+    yield
 
-# Create database tables
-models.Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="General Ledger API",
     description="Account balance tracking system for Software Deployment Lifecycle project",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for frontend access
@@ -28,8 +44,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (brotli or gzip, negotiated via Accept-Encoding)
+app.add_middleware(CompressionMiddleware)
+
 # Initialize Prometheus metrics
-Instrumentator().instrument(app).expose(app)
+if FAST_START:
+    app.add_middleware(DeferredInstrumentationMiddleware)
+    app.add_api_route("/metrics", metrics_endpoint, methods=["GET"])
+else:
+    from prometheus_fastapi_instrumentator import Instrumentator
+    Instrumentator().instrument(app).expose(app)
 
 
 @app.get("/")
@@ -53,7 +77,6 @@ async def health_check():
 @app.get("/demo")
 async def demo_endpoint():
     '''Demo endpoint to showcase deployment lifecycle'''
-    from datetime import datetime
     return {
         "message": "🎉 Demo feature successfully deployed!",
         "timestamp": datetime.now().isoformat(),
@@ -65,11 +88,25 @@ async def demo_endpoint():
 
 # Account endpoints
 
-@app.get("/accounts", response_model=List[schemas.AccountResponse])
-def list_accounts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get list of all accounts with pagination"""
+@app.get(
+    "/accounts",
+    response_model=List[schemas.AccountResponse],
+    responses={200: {"content": {COLUMNAR_JSON_MEDIA_TYPE: {}, MSGPACK_MEDIA_TYPE: {}}}},
+)
+def list_accounts(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """
+    Get list of all accounts with pagination
+    Send Accept: application/vnd.ledger.columnar+json or application/msgpack
+    to receive the columnar format (keys once, one value array per column)
+    """
     accounts = crud.get_accounts(db, skip=skip, limit=limit)
-    return accounts
+    return listing_response(request, response, accounts)
 
 
 @app.post("/accounts", response_model=schemas.AccountResponse, status_code=status.HTTP_201_CREATED)
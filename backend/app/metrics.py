@@ -0,0 +1,34 @@
+"""
+Prometheus metrics wiring that defers imports and registration until first use
+Used by fast-start mode; the regular mode instruments the app at import time
+"""
+from typing import Optional
+
+from fastapi import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class DeferredInstrumentationMiddleware:
+    """
+    Wrap the app in the Prometheus instrumentation middleware on the first request
+    Metric collectors are registered at that point rather than at startup
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.instrumented: Optional[ASGIApp] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if self.instrumented is None:
+            from prometheus_fastapi_instrumentator.middleware import PrometheusInstrumentatorMiddleware
+            self.instrumented = PrometheusInstrumentatorMiddleware(self.app)
+        await self.instrumented(scope, receive, send)
+
+
+def metrics_endpoint() -> Response:
+    """Endpoint that serves Prometheus metrics"""
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+    return Response(content=generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,101 @@
+"""
+Content negotiation helpers for large listing responses
+"""
+from typing import Dict, List, Sequence
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+from . import models, schemas
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is listed in requirements.txt
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.ledger.columnar+json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Column order of the columnar formats, matching AccountResponse
+ACCOUNT_COLUMNS = list(schemas.AccountResponse.model_fields)
+
+_account_list_adapter = TypeAdapter(List[schemas.AccountResponse])
+
+
+def parse_quality_values(header: str) -> Dict[str, float]:
+    """
+    Parse an Accept-style header into a mapping of token -> q-value
+    Tokens are lower-cased; malformed q-values count as 0 (not acceptable)
+    """
+    values: Dict[str, float] = {}
+    for item in header.split(","):
+        token, *params = [part.strip() for part in item.split(";")]
+        if not token:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        values[token.lower()] = quality
+    return values
+
+
+def available_listing_formats() -> List[str]:
+    """Media types list_accounts can produce, in server preference order"""
+    formats = [JSON_MEDIA_TYPE, COLUMNAR_JSON_MEDIA_TYPE]
+    if msgpack is not None:
+        formats.append(MSGPACK_MEDIA_TYPE)
+    return formats
+
+
+def select_listing_format(accept: str) -> str:
+    """
+    Pick the response media type for a listing from the Accept header
+    Plain JSON is used unless the client explicitly prefers another format
+    """
+    accepted = parse_quality_values(accept)
+    best, best_quality = JSON_MEDIA_TYPE, 0.0
+    for media_type in available_listing_formats():
+        quality = accepted.get(media_type, 0.0)
+        if quality > best_quality:
+            best, best_quality = media_type, quality
+    return best
+
+
+def accounts_to_columns(accounts: Sequence[models.Account]) -> Dict[str, list]:
+    """
+    Pivot accounts into a column -> values mapping
+    Values are serialized exactly as in the default JSON listing
+    """
+    rows = _account_list_adapter.dump_python(
+        _account_list_adapter.validate_python(accounts, from_attributes=True),
+        mode="json",
+    )
+    return {column: [row[column] for row in rows] for column in ACCOUNT_COLUMNS}
+
+
+def listing_response(request: Request, response: Response, accounts: Sequence[models.Account]):
+    """
+    Build the list_accounts response for the negotiated format
+    Returns the accounts unchanged for plain JSON so FastAPI applies the response_model
+    """
+    media_type = select_listing_format(request.headers.get("Accept", ""))
+    headers = {"Vary": "Accept"}
+    if media_type == JSON_MEDIA_TYPE:
+        response.headers.update(headers)
+        return accounts
+
+    content = {"count": len(accounts), "columns": accounts_to_columns(accounts)}
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return Response(
+            content=msgpack.packb(content, use_bin_type=True),
+            media_type=MSGPACK_MEDIA_TYPE,
+            headers=headers,
+        )
+    return JSONResponse(content=content, media_type=COLUMNAR_JSON_MEDIA_TYPE, headers=headers)
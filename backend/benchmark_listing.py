@@ -0,0 +1,89 @@
+"""
+Benchmark payload size and end-to-end latency of GET /accounts
+Compares row JSON, columnar JSON and MessagePack, each uncompressed, gzip and brotli,
+at 1k and 10k rows. Runs against a throwaway SQLite database, never DATABASE_URL.
+
+Usage: python benchmark_listing.py [--rows 1000 10000] [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from decimal import Decimal
+
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/benchmark.db"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.database import SessionLocal, init_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Account, PaymentMethod  # noqa: E402
+from app.negotiation import (  # noqa: E402
+    COLUMNAR_JSON_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+)
+
+FORMATS = {
+    "json": JSON_MEDIA_TYPE,
+    "columnar": COLUMNAR_JSON_MEDIA_TYPE,
+    "msgpack": MSGPACK_MEDIA_TYPE,
+}
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+def seed_accounts(total):
+    """Top the benchmark database up to `total` accounts"""
+    init_db()
+    db = SessionLocal()
+    try:
+        methods = list(PaymentMethod)
+        existing = db.query(Account).count()
+        db.add_all([
+            Account(
+                first_name=f"First{i}",
+                last_name=f"Last{i}",
+                balance=Decimal(i % 100000) / 100,
+                payment_method=methods[i % len(methods)],
+            )
+            for i in range(existing, total)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def measure(client, rows, media_type, encoding, repeat):
+    """Return (wire bytes, median latency ms) for one format/encoding combination"""
+    headers = {"Accept": media_type, "Accept-Encoding": encoding}
+    timings = []
+    wire_size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with client.stream("GET", f"/accounts?limit={rows}", headers=headers) as response:
+            wire_size = sum(len(chunk) for chunk in response.iter_raw())
+            response.raise_for_status()
+        timings.append((time.perf_counter() - start) * 1000)
+    return wire_size, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with TestClient(app) as client:
+        print(f"{'rows':>6}  {'format':<9} {'encoding':<9} {'bytes':>10} {'median ms':>10}")
+        for rows in sorted(args.rows):
+            seed_accounts(rows)
+            for format_name, media_type in FORMATS.items():
+                for encoding in ENCODINGS:
+                    size, latency = measure(client, rows, media_type, encoding, args.repeat)
+                    print(f"{rows:>6}  {format_name:<9} {encoding:<9} {size:>10} {latency:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Startup timing report for the General Ledger API
+Shows the slowest imports of app.main (python -X importtime) and the time from
+interpreter start to the first served request, in regular and fast-start mode.
+Runs against in-memory SQLite unless DATABASE_URL is set.
+
+Usage: python profile_startup.py [--top 15] [--repeat 3]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Executed in a fresh interpreter to serve a single request, lifespan included
+FIRST_REQUEST_SCRIPT = """
+from fastapi.testclient import TestClient
+from app.main import app
+with TestClient(app) as client:
+    client.get("/accounts?limit=1").raise_for_status()
+"""
+
+
+def run_python(args, fast_start, **kwargs):
+    """Run a fresh interpreter in the backend directory with the chosen startup mode"""
+    env = dict(os.environ, FAST_START="true" if fast_start else "false")
+    env.setdefault("DATABASE_URL", "sqlite://")
+    return subprocess.run(
+        [sys.executable, *args], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True, check=True, **kwargs
+    )
+
+
+def import_times(fast_start):
+    """Return [(cumulative_us, self_us, module)] for every module imported by app.main"""
+    result = run_python(["-X", "importtime", "-c", "import app.main"], fast_start)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), module.rstrip()))
+    return rows
+
+
+def time_to_first_request(fast_start):
+    """Wall-clock seconds from launching the interpreter to the first /accounts response"""
+    start = time.perf_counter()
+    run_python(["-c", FIRST_REQUEST_SCRIPT], fast_start)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for fast_start in (False, True):
+        mode = "fast-start" if fast_start else "regular"
+        rows = import_times(fast_start)
+        total_us = next(cumulative for cumulative, _, module in rows if module.strip() == "app.main")
+
+        print(f"== {mode} mode: import app.main took {total_us / 1000:.1f} ms ==")
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for cumulative_us, self_us, module in sorted(rows, reverse=True)[:args.top]:
+            print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {module}")
+
+        timings = [time_to_first_request(fast_start) for _ in range(args.repeat)]
+        print(f"time to first request (median of {args.repeat}): {statistics.median(timings) * 1000:.1f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+Shared test configuration
+Defaults to fast-start mode against in-memory SQLite; CI overrides DATABASE_URL with MariaDB
+"""
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("FAST_START", "true")
@@ -2,6 +2,10 @@
 API integration tests for the General Ledger application
 These tests verify that all endpoints work correctly
 """
+import os
+import subprocess
+import sys
+
 import pytest
 from fastapi.testclient import TestClient
 from decimal import Decimal
@@ -298,4 +302,131 @@ class TestTransactions:
             "description": "Test"
         }
         response = client.post("/accounts/999999/transaction", json=transaction_data)
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+class TestListingFormats:
+    """Test negotiated response formats for the account listing"""
+
+    def test_default_format_is_row_json(self):
+        """Test that plain JSON is returned without a format preference"""
+        response = client.get("/accounts")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/json")
+        assert isinstance(response.json(), list)
+
+    def test_columnar_json_format(self):
+        """Test that columnar JSON lists each key once with a value array"""
+        client.post("/accounts", json={
+            "first_name": "Columnar",
+            "last_name": "Test",
+            "balance": 12.50,
+            "payment_method": "cash"
+        })
+        rows = client.get("/accounts?limit=1000").json()
+
+        response = client.get(
+            "/accounts?limit=1000",
+            headers={"Accept": "application/vnd.ledger.columnar+json"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/vnd.ledger.columnar+json")
+
+        data = response.json()
+        assert data["count"] == len(rows)
+        assert set(data["columns"]) == set(rows[0])
+        for column, values in data["columns"].items():
+            assert values == [row[column] for row in rows]
+
+    def test_msgpack_format(self):
+        """Test that MessagePack carries the same columnar payload"""
+        msgpack = pytest.importorskip("msgpack")
+        columnar = client.get(
+            "/accounts",
+            headers={"Accept": "application/vnd.ledger.columnar+json"}
+        ).json()
+
+        response = client.get("/accounts", headers={"Accept": "application/msgpack"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content) == columnar
+
+    def test_format_respects_quality_values(self):
+        """Test that a format with q=0 is never selected"""
+        response = client.get(
+            "/accounts",
+            headers={"Accept": "application/vnd.ledger.columnar+json;q=0, application/json"}
+        )
+        assert isinstance(response.json(), list)
+
+
+class TestCompression:
+    """Test negotiated response compression"""
+
+    def _seed_accounts(self, count):
+        for i in range(count):
+            client.post("/accounts", json={
+                "first_name": f"Compress{i}",
+                "last_name": "Test",
+                "balance": 10.00,
+                "payment_method": "cash"
+            })
+
+    def test_gzip_large_response(self):
+        """Test that large responses are gzip-compressed when requested"""
+        self._seed_accounts(20)
+        response = client.get("/accounts", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert isinstance(response.json(), list)
+
+    def test_brotli_preferred(self):
+        """Test that brotli is used when the client accepts it"""
+        pytest.importorskip("brotli")
+        self._seed_accounts(20)
+        response = client.get("/accounts", headers={"Accept-Encoding": "gzip, br"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "br"
+        assert isinstance(response.json(), list)
+
+    def test_small_response_not_compressed(self):
+        """Test that responses below the size threshold stay uncompressed"""
+        response = client.get("/health", headers={"Accept-Encoding": "gzip, br"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"status": "healthy"}
+
+    def test_no_compression_without_accept_encoding(self):
+        """Test that responses are uncompressed when the client does not ask"""
+        self._seed_accounts(20)
+        response = client.get("/accounts", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+
+
+class TestFastStart:
+    """Test lazy initialization in fast-start mode"""
+
+    def test_import_defers_engine_and_metrics(self):
+        """Test that importing the app creates no engine and loads no Prometheus modules"""
+        script = (
+            "import sys, app.main, app.database as database; "
+            "assert database._engine is None; "
+            "assert 'prometheus_client' not in sys.modules"
+        )
+        env = dict(os.environ, FAST_START="true", DATABASE_URL="sqlite://")
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", script], cwd=backend_dir, env=env)
+        assert result.returncode == 0
+
+    def test_metrics_endpoint(self):
+        """Test that request metrics are exposed after the first request"""
+        client.get("/health")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert "http_requests_total" in response.text
+
+    def test_demo_endpoint(self):
+        """Test that the demo endpoint returns a timestamp"""
+        response = client.get("/demo")
+        assert response.status_code == 200
+        assert "timestamp" in response.json()